@@ -140,7 +140,46 @@ contract BountyLedger {
         emit ActivityLogged(idx, chain, action);
     }
 
+    /// @notice Log many activities in one transaction (same storage + events as logActivity)
+    function logActivityBatch(
+        string[] calldata chains,
+        string[] calldata actions,
+        string[] calldata details
+    ) external onlyAgent returns (uint256 firstIdx) {
+        require(
+            chains.length == actions.length && actions.length == details.length,
+            "length mismatch"
+        );
+        firstIdx = activityLog.length;
+        for (uint256 i = 0; i < chains.length; i++) {
+            activityLog.push(ActivityLog({
+                chain: chains[i],
+                action: actions[i],
+                details: details[i],
+                timestamp: block.timestamp
+            }));
+            emit ActivityLogged(firstIdx + i, chains[i], actions[i]);
+        }
+    }
+
     function totalActivities() external view returns (uint256) {
         return activityLog.length;
     }
+
+    // --- Batching ---
+
+    /// @notice Run several calls to this contract (e.g. logActivity + claimBounty) in one tx
+    /// @dev delegatecall keeps msg.sender, so onlyAgent still applies to each call
+    function multicall(bytes[] calldata data) external onlyAgent returns (bytes[] memory results) {
+        results = new bytes[](data.length);
+        for (uint256 i = 0; i < data.length; i++) {
+            (bool ok, bytes memory ret) = address(this).delegatecall(data[i]);
+            if (!ok) {
+                assembly {
+                    revert(add(ret, 32), mload(ret))
+                }
+            }
+            results[i] = ret;
+        }
+    }
 }
@@ -9,18 +9,26 @@ Reads actual activity from:
 - Bounty scan results
 
 Each logActivity() call costs ~$0.001 on opBNB. 30 entries = $0.03.
+Trades are bridged in a single logActivityBatch() call.
 """
 
 from __future__ import annotations
 
+import getpass
 import json
 import os
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 # --- Paths ---
 ROOT = Path(__file__).resolve().parent.parent
 DEPLOYED_JSON = ROOT / "deployed.json"
@@ -31,10 +39,33 @@ TRADES_JSONL = Path.home() / ".openclaw" / "workspace" / "trades.jsonl"
 OPBNB_RPC = "https://opbnb-mainnet-rpc.bnbchain.org"
 OPBNB_CHAIN_ID = 204
 KEYCHAIN_SERVICE = "evm-wallet-metamask-privkey"
+GAS_PRICE_TTL = 60  # seconds; opBNB gas price is effectively constant
+GAS_HEADROOM = 1.2  # multiplier on estimate_gas
+GAS_BUMP = 1.15  # gas price multiplier when re-sending after a nonce collision
+NONCE_ERRORS = ("nonce too low", "replacement transaction underpriced")
 
 WALLET_ADDRESS = "0xa31232040883e551E0390B0c621f1e689b0b8814"
 MACX_TOKEN = "0xC0e49f8C615d3d4c245970F6Dc528E4A47d69a44"
 BASE_RPC = "https://mainnet.base.org"
+MULTICALL3 = "0xcA11bde05977b3631167028862bE2a173976CA11"  # same address on every EVM chain
+
+# Static part of the agent status entry; only the timestamp changes per call
+AGENT_STATUS = {
+    "agent": "crusty_macx",
+    "runtime": "openclaw",
+    "model": "claude-opus-4-6",
+    "skills_installed": 76,
+    "cron_jobs_active": 7,
+    "chains_active": ("polygon", "base", "opbnb"),
+}
+
+# Shared keep-alive HTTP session for the opBNB and Base Web3 providers
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+))
 
 
 def log(msg: str):
@@ -42,6 +73,97 @@ def log(msg: str):
     print(f"[{ts}] {msg}")
 
 
+def read_private_key() -> str:
+    """Read the wallet key from the OS keychain.
+
+    Uses keyring in-process when installed; falls back to the macOS `security` CLI.
+    """
+    privkey = None
+    try:
+        import keyring
+
+        privkey = keyring.get_password(KEYCHAIN_SERVICE, getpass.getuser())
+    except Exception:  # keyring missing or no usable backend
+        pass
+    if not privkey:
+        privkey = subprocess.check_output(
+            ["security", "find-generic-password", "-s", KEYCHAIN_SERVICE, "-w"],
+            text=True,
+        )
+    privkey = privkey.strip()
+    if not privkey.startswith("0x"):
+        privkey = "0x" + privkey
+    return privkey
+
+
+_W3_CACHE: dict = {}
+
+
+def get_w3(rpc_url: str):
+    """Return one Web3 instance per RPC URL, reused across calls (keep-alive via SESSION)."""
+    from web3 import Web3
+
+    w3 = _W3_CACHE.get(rpc_url)
+    if w3 is None:
+        w3 = _W3_CACHE[rpc_url] = Web3(Web3.HTTPProvider(
+            rpc_url, session=SESSION, request_kwargs={"timeout": 15}
+        ))
+    return w3
+
+
+def encode_details(details: dict) -> str:
+    """Compact JSON for the on-chain details field (no whitespace = fewer calldata bytes)."""
+    return json.dumps(details, separators=(",", ":"), default=str)[:500]
+
+
+def iter_trades(path: Path = TRADES_JSONL):
+    """Stream entries from a JSONL trades log, skipping blank or malformed lines."""
+    with path.open("rb") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+
+
+# --- Trade -> (chain, action, details) handlers ---
+
+def _trade_details(entry: dict) -> dict:
+    return {"action": entry.get("action"), "timestamp": entry.get("timestamp")}
+
+
+def _handle_placed_trade(entry: dict) -> tuple[str, str, dict]:
+    return "polygon", "trade_placed", {
+        **_trade_details(entry),
+        "market": entry.get("market_name", "unknown"),
+        "side": entry.get("side"),
+        "price": entry.get("price"),
+        "size_usdc": entry.get("size_usdc"),
+        "expected_return": entry.get("expected_return"),
+    }
+
+
+def _handle_cancelled_trade(entry: dict) -> tuple[str, str, dict]:
+    return "polygon", "trade_cancelled", {
+        **_trade_details(entry),
+        "order_id": entry.get("order_id", "")[:20],
+    }
+
+
+def _handle_generic_trade(entry: dict) -> tuple[str, str, dict]:
+    action = entry.get("action", "unknown").lower()
+    return "polygon", action, {**_trade_details(entry), "raw_action": action}
+
+
+TRADE_HANDLERS = {
+    "order_placed": _handle_placed_trade,
+    "cancel": _handle_cancelled_trade,
+}
+
+
 class ActivityBridge:
     """Bridges real activity from multiple chains to BountyLedger on opBNB."""
 
@@ -56,56 +178,161 @@ class ActivityBridge:
         self.contract_addr = deploy_info["address"]
         abi = json.loads(ABI_PATH.read_text())
 
-        self.w3 = Web3(Web3.HTTPProvider(OPBNB_RPC))
-        if not self.w3.is_connected():
-            print("ERROR: Cannot connect to opBNB RPC")
-            sys.exit(1)
+        self.w3 = get_w3(OPBNB_RPC)
 
-        privkey = subprocess.check_output(
-            ["security", "find-generic-password", "-s", KEYCHAIN_SERVICE, "-w"],
-            text=True,
-        ).strip()
-        if not privkey.startswith("0x"):
-            privkey = "0x" + privkey
+        # Overlap the opBNB RPC reads with each other and with the keychain lookup
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            f_connected = ex.submit(self.w3.is_connected)
+
+            self.account = self.w3.eth.account.from_key(read_private_key())
+            # "pending" counts our own mempool txs, so a stuck tx from a prior run isn't replaced
+            f_nonce = ex.submit(self.w3.eth.get_transaction_count, self.account.address, "pending")
+            f_bal = ex.submit(self.w3.eth.get_balance, self.account.address)
+
+            if not f_connected.result():
+                print("ERROR: Cannot connect to opBNB RPC")
+                sys.exit(1)
+            self.nonce = f_nonce.result()
+            bal = f_bal.result()
 
-        self.account = self.w3.eth.account.from_key(privkey)
         self.contract = self.w3.eth.contract(
             address=Web3.to_checksum_address(self.contract_addr), abi=abi
         )
+        self._gas_price = None
+        self._gas_price_ts = 0.0
+        self._pending: list[tuple] = []  # (tx_hash, n_entries) awaiting receipts
 
-        self.nonce = self.w3.eth.get_transaction_count(self.account.address)
-
-        bal = self.w3.eth.get_balance(self.account.address)
         log(f"Wallet: {self.account.address}")
         log(f"Contract: {self.contract_addr}")
         log(f"Balance: {self.w3.from_wei(bal, 'ether')} BNB")
 
-    def _send_tx(self, fn) -> str | None:
+    def _get_gas_price(self) -> int:
+        """Return gas price, refreshing from RPC at most every GAS_PRICE_TTL seconds."""
+        now = time.monotonic()
+        if self._gas_price is None or now - self._gas_price_ts > GAS_PRICE_TTL:
+            self._gas_price = self.w3.eth.gas_price
+            self._gas_price_ts = now
+        return self._gas_price
+
+    def _submit_tx(self, fn, gas: int = 500_000):
+        """Build, sign, and broadcast a tx without waiting for it to be mined."""
         try:
-            tx = fn.build_transaction({
-                "from": self.account.address,
-                "nonce": self.nonce,
-                "gas": 500_000,
-                "gasPrice": self.w3.eth.gas_price,
-                "chainId": OPBNB_CHAIN_ID,
-            })
-            signed = self.account.sign_transaction(tx)
-            tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=30)
-            self.nonce += 1
-            return receipt.transactionHash.hex()
+            gas_price = self._get_gas_price()
+            for attempt in range(2):
+                tx = fn.build_transaction({
+                    "from": self.account.address,
+                    "nonce": self.nonce,
+                    "gas": gas,
+                    "gasPrice": gas_price,
+                    "chainId": OPBNB_CHAIN_ID,
+                })
+                signed = self.account.sign_transaction(tx)
+                try:
+                    tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+                    break
+                except Exception as e:
+                    if attempt or not any(m in str(e).lower() for m in NONCE_ERRORS):
+                        raise
+                    log(f"  Nonce {self.nonce} collided ({e}), refetching pending nonce")
+                    self.nonce = self.w3.eth.get_transaction_count(self.account.address, "pending")
+                    gas_price = int(gas_price * GAS_BUMP)
         except Exception as e:
             log(f"  TX failed: {e}")
             return None
+        # Nonce is consumed once broadcast; never reuse it for the next tx
+        self.nonce += 1
+        return tx_hash
 
-    def log_activity(self, chain: str, action: str, details: dict) -> str | None:
-        details_str = json.dumps(details, default=str)[:500]
+    def _await_tx(self, tx_hash) -> str | None:
+        try:
+            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=30)
+        except Exception as e:
+            log(f"  TX failed: {e}")
+            return None
+        if receipt.status != 1:
+            log(f"  TX reverted: {receipt.transactionHash.hex()}")
+            return None
+        return receipt.transactionHash.hex()
+
+    def _send_tx(self, fn, gas: int = 500_000) -> str | None:
+        tx_hash = self._submit_tx(fn, gas)
+        return self._await_tx(tx_hash) if tx_hash else None
+
+    def _dispatch(self, fn, n_entries: int, gas: int, wait: bool) -> str | None:
+        """Send and confirm now, or queue the hash for wait_pending()."""
+        if wait:
+            return self._send_tx(fn, gas)
+        tx_hash = self._submit_tx(fn, gas)
+        if tx_hash is None:
+            return None
+        self._pending.append((tx_hash, n_entries))
+        return tx_hash.hex()
+
+    def wait_pending(self) -> int:
+        """Wait for all queued txs in parallel; return the number of entries confirmed."""
+        pending, self._pending = self._pending, []
+        return self._await_all(pending)
+
+    def _await_all(self, pending: list[tuple]) -> int:
+        """Wait for (tx_hash, n_entries) pairs in parallel; return entries confirmed."""
+        if not pending:
+            return 0
+        with ThreadPoolExecutor(max_workers=len(pending)) as ex:
+            results = list(ex.map(lambda p: self._await_tx(p[0]), pending))
+        confirmed = 0
+        for (_, n_entries), tx_hash in zip(pending, results):
+            if tx_hash:
+                confirmed += n_entries
+                log(f"  Confirmed: {tx_hash[:16]}... ({n_entries} entries)")
+        return confirmed
+
+    def log_activity(self, chain: str, action: str, details: dict, wait: bool = True) -> str | None:
+        details_str = encode_details(details)
         fn = self.contract.functions.logActivity(chain, action, details_str)
-        tx_hash = self._send_tx(fn)
+        tx_hash = self._dispatch(fn, 1, 500_000, wait)
         if tx_hash:
-            log(f"  Logged: {chain}/{action} -> {tx_hash[:16]}...")
+            log(f"  {'Logged' if wait else 'Sent'}: {chain}/{action} -> {tx_hash[:16]}...")
         return tx_hash
 
+    def log_activity_batch(self, entries: list[tuple[str, str, dict]], wait: bool = True) -> int:
+        """Log many (chain, action, details) entries in a single logActivityBatch tx.
+
+        Falls back to pipelined per-entry logActivity txs when the deployed contract
+        predates logActivityBatch. Returns the number of entries logged (or sent).
+        """
+        from web3.exceptions import ContractLogicError
+
+        if not entries:
+            return 0
+        chains = [chain for chain, _, _ in entries]
+        actions = [action for _, action, _ in entries]
+        details = [encode_details(d) for _, _, d in entries]
+        fn = self.contract.functions.logActivityBatch(chains, actions, details)
+        try:
+            gas = int(fn.estimate_gas({"from": self.account.address}) * GAS_HEADROOM)
+        except ContractLogicError as e:
+            # Unknown selectors revert; any other error would fail per-entry txs too
+            log(f"  logActivityBatch unavailable ({e}), sending entries one by one")
+            submitted = []
+            for chain, action, details_str in zip(chains, actions, details):
+                fn = self.contract.functions.logActivity(chain, action, details_str)
+                tx_hash = self._submit_tx(fn)
+                if tx_hash:
+                    submitted.append((tx_hash, 1))
+            # Wait only on this batch's txs; earlier non-waited ones stay queued
+            if wait:
+                return self._await_all(submitted)
+            self._pending.extend(submitted)
+            return len(submitted)
+        except Exception as e:
+            log(f"  logActivityBatch gas estimate failed: {e}")
+            return 0
+        tx_hash = self._dispatch(fn, len(entries), gas, wait)
+        if not tx_hash:
+            return 0
+        log(f"  {'Logged' if wait else 'Sent'} batch of {len(entries)} -> {tx_hash[:16]}...")
+        return len(entries)
+
     # --- Data Sources ---
 
     def load_polymarket_trades(self) -> list[dict]:
@@ -114,16 +341,7 @@ class ActivityBridge:
             log("No trades.jsonl found")
             return []
 
-        trades = []
-        for line in TRADES_JSONL.read_text().strip().split("\n"):
-            if not line.strip():
-                continue
-            try:
-                entry = json.loads(line)
-                trades.append(entry)
-            except json.JSONDecodeError:
-                continue
-
+        trades = list(iter_trades())
         log(f"Loaded {len(trades)} Polymarket trade entries")
         return trades
 
@@ -132,7 +350,7 @@ class ActivityBridge:
         try:
             from web3 import Web3
 
-            base_w3 = Web3(Web3.HTTPProvider(BASE_RPC))
+            base_w3 = get_w3(BASE_RPC)
             if not base_w3.is_connected():
                 log("Cannot connect to Base RPC")
                 return None
@@ -153,13 +371,52 @@ class ActivityBridge:
                     "type": "function",
                 },
             ]
-            token = base_w3.eth.contract(
-                address=Web3.to_checksum_address(MACX_TOKEN), abi=erc20_abi
+            multicall_abi = [
+                {
+                    "inputs": [
+                        {
+                            "components": [
+                                {"name": "target", "type": "address"},
+                                {"name": "callData", "type": "bytes"},
+                            ],
+                            "name": "calls",
+                            "type": "tuple[]",
+                        }
+                    ],
+                    "name": "aggregate",
+                    "outputs": [
+                        {"name": "blockNumber", "type": "uint256"},
+                        {"name": "returnData", "type": "bytes[]"},
+                    ],
+                    "stateMutability": "payable",
+                    "type": "function",
+                },
+            ]
+            token_addr = Web3.to_checksum_address(MACX_TOKEN)
+            token = base_w3.eth.contract(address=token_addr, abi=erc20_abi)
+            multicall = base_w3.eth.contract(
+                address=Web3.to_checksum_address(MULTICALL3), abi=multicall_abi
             )
-            balance_raw = token.functions.balanceOf(
-                Web3.to_checksum_address(WALLET_ADDRESS)
-            ).call()
-            decimals = token.functions.decimals().call()
+
+            wallet = Web3.to_checksum_address(WALLET_ADDRESS)
+
+            try:
+                # balanceOf + decimals in a single eth_call
+                calls = [
+                    (token_addr, token.encode_abi("balanceOf", args=[wallet])),
+                    (token_addr, token.encode_abi("decimals")),
+                ]
+                _, (balance_data, decimals_data) = multicall.functions.aggregate(calls).call()
+                (balance_raw,) = base_w3.codec.decode(["uint256"], balance_data)
+                (decimals,) = base_w3.codec.decode(["uint8"], decimals_data)
+            except Exception as e:
+                # No Multicall3: coalesce both eth_calls into one JSON-RPC batch POST.
+                # web3 matches responses to requests by id, not array position.
+                log(f"Multicall3 unavailable ({e}), using JSON-RPC batch")
+                with base_w3.batch_requests() as batch:
+                    batch.add(token.functions.balanceOf(wallet))
+                    batch.add(token.functions.decimals())
+                    balance_raw, decimals = batch.execute()
             balance = balance_raw / (10 ** decimals)
 
             log(f"$MACX balance on Base: {balance:,.2f}")
@@ -170,46 +427,25 @@ class ActivityBridge:
 
     # --- Bridge Operations ---
 
-    def bridge_polymarket_trades(self, trades: list[dict], max_entries: int = 15):
-        """Log Polymarket trades to opBNB contract."""
-        logged = 0
+    def bridge_polymarket_trades(self, trades: list[dict], max_entries: int = 15, wait: bool = True):
+        """Log Polymarket trades to opBNB contract in one batched tx."""
+        entries = []
         for entry in trades:
-            if logged >= max_entries:
+            if len(entries) >= max_entries:
                 break
 
             action = entry.get("action", "unknown").lower()
             if action == "blocked":
                 continue
 
-            details = {
-                "action": entry.get("action"),
-                "timestamp": entry.get("timestamp"),
-            }
-
-            if action == "order_placed":
-                details.update({
-                    "market": entry.get("market_name", "unknown"),
-                    "side": entry.get("side"),
-                    "price": entry.get("price"),
-                    "size_usdc": entry.get("size_usdc"),
-                    "expected_return": entry.get("expected_return"),
-                })
-                tx = self.log_activity("polygon", "trade_placed", details)
-            elif action == "cancel":
-                details["order_id"] = entry.get("order_id", "")[:20]
-                tx = self.log_activity("polygon", "trade_cancelled", details)
-            else:
-                details["raw_action"] = action
-                tx = self.log_activity("polygon", action, details)
-
-            if tx:
-                logged += 1
-                time.sleep(0.5)
+            handler = TRADE_HANDLERS.get(action, _handle_generic_trade)
+            entries.append(handler(entry))
 
+        logged = self.log_activity_batch(entries, wait=wait)
         log(f"Bridged {logged} Polymarket trades to opBNB")
         return logged
 
-    def bridge_macx_balance(self):
+    def bridge_macx_balance(self, wait: bool = True):
         """Log $MACX balance snapshot to opBNB."""
         macx = self.load_macx_balance()
         if macx:
@@ -218,20 +454,15 @@ class ActivityBridge:
                 "token_address": macx["token"],
                 "wallet": WALLET_ADDRESS,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
-            })
+            }, wait=wait)
         return None
 
-    def bridge_agent_status(self):
+    def bridge_agent_status(self, wait: bool = True):
         """Log overall agent status."""
         return self.log_activity("opbnb", "agent_status_update", {
-            "agent": "crusty_macx",
-            "runtime": "openclaw",
-            "model": "claude-opus-4-6",
-            "skills_installed": 76,
-            "cron_jobs_active": 7,
-            "chains_active": ["polygon", "base", "opbnb"],
+            **AGENT_STATUS,
             "timestamp": datetime.now(timezone.utc).isoformat(),
-        })
+        }, wait=wait)
 
 
 def main():
@@ -253,20 +484,21 @@ def main():
         log("DRY RUN — showing what would be logged:\n")
         if args.trades or args.all:
             if TRADES_JSONL.exists():
-                trades = []
-                for line in TRADES_JSONL.read_text().strip().split("\n"):
-                    if line.strip():
-                        try:
-                            trades.append(json.loads(line))
-                        except json.JSONDecodeError:
-                            pass
-                placed = [t for t in trades if t.get("action") == "ORDER_PLACED"]
-                log(f"  Polymarket: {len(placed)} ORDER_PLACED entries to bridge")
-                for t in placed[:5]:
+                # Count + keep 5 samples so memory stays flat however large the log is
+                placed_count = 0
+                samples = []
+                for t in iter_trades():
+                    if t.get("action") != "ORDER_PLACED":
+                        continue
+                    placed_count += 1
+                    if len(samples) < 5:
+                        samples.append(t)
+                log(f"  Polymarket: {placed_count} ORDER_PLACED entries to bridge")
+                for t in samples:
                     market = t.get("market_name", "unknown")
                     log(f"    - {market}: ${t.get('size_usdc')} at {t.get('price')}")
-                if len(placed) > 5:
-                    log(f"    ... and {len(placed) - 5} more")
+                if placed_count > 5:
+                    log(f"    ... and {placed_count - 5} more")
         if args.macx or args.all:
             log("  Base: $MACX balance snapshot")
         if args.status or args.all:
@@ -274,24 +506,23 @@ def main():
         return
 
     bridge = ActivityBridge()
-    total_logged = 0
 
+    # Submit everything back-to-back (increasing nonces), then wait once
     if args.trades or args.all:
         log("\n--- Bridging Polymarket trades ---")
         trades = bridge.load_polymarket_trades()
-        total_logged += bridge.bridge_polymarket_trades(trades, args.max_trades)
+        bridge.bridge_polymarket_trades(trades, args.max_trades, wait=False)
 
     if args.macx or args.all:
         log("\n--- Bridging $MACX balance ---")
-        tx = bridge.bridge_macx_balance()
-        if tx:
-            total_logged += 1
+        bridge.bridge_macx_balance(wait=False)
 
     if args.status or args.all:
         log("\n--- Logging agent status ---")
-        tx = bridge.bridge_agent_status()
-        if tx:
-            total_logged += 1
+        bridge.bridge_agent_status(wait=False)
+
+    log("\n--- Waiting for confirmations ---")
+    total_logged = bridge.wait_pending()
 
     log(f"\nDone! {total_logged} entries logged to opBNB contract.")
     log(f"View at: https://opbnbscan.com/address/{bridge.contract_addr}")
@@ -10,26 +10,35 @@ Records all activity to the cross-chain ActivityLog — making BSC the agent's "
 from __future__ import annotations
 
 import argparse
+import functools
+import getpass
+import hashlib
 import json
 import os
 import re
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
-import requests
+import orjson
 
 # --- Paths ---
 ROOT = Path(__file__).resolve().parent.parent
 DEPLOYED_JSON = ROOT / "deployed.json"
 ABI_PATH = ROOT / "abi" / "BountyLedger.json"
+CACHE_DIR = ROOT / ".cache"
+DELIVERY_CACHE = CACHE_DIR / "delivery.json"
 
 # --- Configuration ---
 OPBNB_RPC = "https://opbnb-mainnet-rpc.bnbchain.org"
 OPBNB_CHAIN_ID = 204
 KEYCHAIN_SERVICE = "evm-wallet-metamask-privkey"
+FEE_TTL = 20  # seconds between EIP-1559 fee refreshes
+GAS_HEADROOM = 1.2  # multiplier on estimate_gas
 
 PLATFORMS = {
     "bountycaster": {
@@ -47,6 +56,15 @@ PLATFORMS = {
     },
 }
 
+GITHUB_QUERIES = [
+    "label:bounty state:open language:python",
+    "label:bounty state:open language:javascript",
+    "label:bounty state:open language:solidity",
+    "label:reward state:open",
+]
+
+GITHUB_ISSUE_FIELDS = ("title", "body", "number", "html_url", "repository_url")
+
 CAPABILITY_KEYWORDS = [
     "code", "script", "api", "python", "javascript", "solidity",
     "smart contract", "bot", "automation", "research", "analyze",
@@ -54,7 +72,22 @@ CAPABILITY_KEYWORDS = [
     "test", "documentation", "markdown", "convert", "migrate",
 ]
 
+# One compiled alternation = a single pass over the title instead of one scan per keyword.
+# The zero-width lookahead tries every position, so overlapping keywords ("javascript"
+# and "script") are all found, same as a substring check per keyword. This relies on
+# no keyword being a prefix of another.
+KW_RE = re.compile("(?=(" + "|".join(map(re.escape, CAPABILITY_KEYWORDS)) + "))")
+
+# First "$1,234.56"-style amount in an issue body
+REWARD_RE = re.compile(r"\$\s*(\d+(?:,\d{3})*(?:\.\d{2})?)")
+
 MIN_REWARD_USD = 25
+SCAN_CACHE_TTL = 300  # seconds; platform listings change slowly
+DELIVERY_CACHE_TTL = 6 * 3600  # seconds; reuse claude analyses across cron runs
+DELIVERY_WORKERS = 3  # concurrent claude -p subprocesses
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
 
 
 def log(msg: str):
@@ -62,6 +95,75 @@ def log(msg: str):
     print(f"[{ts}] {msg}", file=sys.stderr)
 
 
+def read_private_key() -> str:
+    """Read the wallet key from the OS keychain.
+
+    Uses keyring in-process when installed; falls back to the macOS `security` CLI.
+    """
+    privkey = None
+    try:
+        import keyring
+
+        privkey = keyring.get_password(KEYCHAIN_SERVICE, getpass.getuser())
+    except Exception:  # keyring missing or no usable backend
+        pass
+    if not privkey:
+        privkey = subprocess.check_output(
+            ["security", "find-generic-password", "-s", KEYCHAIN_SERVICE, "-w"],
+            text=True,
+        )
+    privkey = privkey.strip()
+    if not privkey.startswith("0x"):
+        privkey = "0x" + privkey
+    return privkey
+
+
+def get_session():
+    """Shared keep-alive HTTP session (scanners + Web3 providers), built on first use.
+
+    requests is imported here so --help and fully cached scans never load it.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            _SESSION = requests.Session()
+            _SESSION.mount("https://", HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=32,
+                max_retries=Retry(total=3, backoff_factor=0.3),
+            ))
+    return _SESSION
+
+
+_W3_CACHE: dict = {}
+
+
+def get_w3(rpc_url: str):
+    """Return one Web3 instance per RPC URL, reused across calls (keep-alive via get_session())."""
+    from web3 import Web3
+
+    w3 = _W3_CACHE.get(rpc_url)
+    if w3 is None:
+        w3 = _W3_CACHE[rpc_url] = Web3(Web3.HTTPProvider(
+            rpc_url, session=get_session(), request_kwargs={"timeout": 15}
+        ))
+    return w3
+
+
+@functools.lru_cache(maxsize=1)
+def _load_abi() -> list:
+    return orjson.loads(ABI_PATH.read_bytes())
+
+
+@functools.lru_cache(maxsize=1)
+def _load_deploy_info() -> dict:
+    return orjson.loads(DEPLOYED_JSON.read_bytes())
+
+
 # --- On-chain Recording (BNBRecorder) ---
 
 class BNBRecorder:
@@ -72,6 +174,10 @@ class BNBRecorder:
         self.w3 = None
         self.contract = None
         self.account = None
+        self.nonce = None
+        self._fees = None  # (maxFeePerGas, maxPriorityFeePerGas)
+        self._fees_ts = 0.0
+        self._queued: list[tuple[str, list]] = []  # (function name, args) for flush()
 
         if not DEPLOYED_JSON.exists():
             log("No deployed.json — on-chain recording disabled")
@@ -80,26 +186,30 @@ class BNBRecorder:
         try:
             from web3 import Web3
 
-            deploy_info = json.loads(DEPLOYED_JSON.read_text())
+            deploy_info = _load_deploy_info()
             contract_addr = deploy_info["address"]
-            abi = json.loads(ABI_PATH.read_text())
+            abi = _load_abi()
 
-            self.w3 = Web3(Web3.HTTPProvider(OPBNB_RPC))
+            self.w3 = get_w3(OPBNB_RPC)
             if not self.w3.is_connected():
                 log("Cannot connect to opBNB RPC — on-chain recording disabled")
                 return
 
-            privkey = subprocess.check_output(
-                ["security", "find-generic-password", "-s", KEYCHAIN_SERVICE, "-w"],
-                text=True,
-            ).strip()
-            if not privkey.startswith("0x"):
-                privkey = "0x" + privkey
-
-            self.account = self.w3.eth.account.from_key(privkey)
+            self.account = self.w3.eth.account.from_key(read_private_key())
             self.contract = self.w3.eth.contract(
                 address=Web3.to_checksum_address(contract_addr), abi=abi
             )
+            # Nonce + fees in one JSON-RPC batch; nonce is tracked locally from here on
+            try:
+                with self.w3.batch_requests() as batch:
+                    batch.add(self.w3.eth.get_transaction_count(self.account.address, "pending"))
+                    batch.add(self.w3.eth.fee_history(5, "latest", [50]))
+                    self.nonce, history = batch.execute()
+                self._set_fees(history)
+            except Exception as e:
+                log(f"RPC batch failed ({e}), fetching nonce and fees separately")
+                self.nonce = self.w3.eth.get_transaction_count(self.account.address, "pending")
+                self._get_fees()
             self.enabled = True
             log(f"On-chain recording enabled: {contract_addr[:10]}...")
         except ImportError:
@@ -107,25 +217,78 @@ class BNBRecorder:
         except Exception as e:
             log(f"BNBRecorder init error: {e}")
 
-    def _send_tx(self, fn):
-        """Build, sign, and send a contract transaction."""
-        if not self.enabled:
-            return None
+    def _set_fees(self, history):
+        """Derive EIP-1559 fee fields from an eth_feeHistory result."""
+        base_fee = history["baseFeePerGas"][-1]  # base fee of the next block
+        tips = sorted(r[0] for r in history["reward"])
+        priority_fee = max(tips[len(tips) // 2], 1) if tips else 1
+        self._fees = (2 * base_fee + priority_fee, priority_fee)
+        self._fees_ts = time.monotonic()
+
+    def _get_fees(self) -> tuple[int, int]:
+        """Return (maxFeePerGas, maxPriorityFeePerGas), refreshed at most every FEE_TTL seconds."""
+        if self._fees is None or time.monotonic() - self._fees_ts > FEE_TTL:
+            try:
+                self._set_fees(self.w3.eth.fee_history(5, "latest", [50]))
+            except Exception:
+                # No eth_feeHistory on this RPC: cap both fees at the legacy gas price
+                gas_price = self.w3.eth.gas_price
+                self._fees = (gas_price, gas_price)
+                self._fees_ts = time.monotonic()
+        return self._fees
+
+    def _broadcast(self, fn):
+        """Build, sign, and send a contract transaction.
+
+        Returns the tx hash once the node accepts it, or None if nothing was sent.
+        """
         try:
+            max_fee, priority_fee = self._get_fees()
+            gas_est = fn.estimate_gas({"from": self.account.address})
             tx = fn.build_transaction({
                 "from": self.account.address,
-                "nonce": self.w3.eth.get_transaction_count(self.account.address),
-                "gas": 500_000,
-                "gasPrice": self.w3.eth.gas_price,
+                "nonce": self.nonce,
+                "gas": int(gas_est * GAS_HEADROOM),
+                "maxFeePerGas": max_fee,
+                "maxPriorityFeePerGas": priority_fee,
+                "type": 2,
                 "chainId": OPBNB_CHAIN_ID,
             })
             signed = self.account.sign_transaction(tx)
             tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=30)
-            return receipt.transactionHash.hex()
+            self.nonce += 1
+            return tx_hash
         except Exception as e:
             log(f"TX failed: {e}")
+            try:
+                self.nonce = self.w3.eth.get_transaction_count(self.account.address, "pending")
+            except Exception:
+                pass
+            return None
+
+    def _confirm(self, tx_hash):
+        """Wait for a sent tx; return its hash if it succeeded, None if it reverted or timed out."""
+        try:
+            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=30)
+        except Exception as e:
+            log(f"TX receipt error: {e}")
+            return None
+        if receipt.status != 1:
+            log(f"TX reverted: {tx_hash.hex()}")
             return None
+        return tx_hash.hex()
+
+    def _send_tx(self, fn, wait: bool = True):
+        """Send a contract transaction, by default waiting for a successful receipt.
+
+        With wait=False, return the hash as soon as the node accepts the tx.
+        """
+        if not self.enabled:
+            return None
+        tx_hash = self._broadcast(fn)
+        if tx_hash is None:
+            return None
+        return self._confirm(tx_hash) if wait else tx_hash.hex()
 
     def claim_bounty(self, platform: str, bounty_id: str, title: str, reward_usd: float):
         """Record a bounty claim on-chain."""
@@ -139,24 +302,111 @@ class BNBRecorder:
     def log_activity(self, chain: str, action: str, details: str):
         """Log a cross-chain activity entry."""
         fn = self.contract.functions.logActivity(chain, action, details[:500])
-        tx = self._send_tx(fn)
+        tx = self._send_tx(fn, wait=False)
         if tx:
-            log(f"Activity logged on-chain: {tx}")
+            log(f"Activity sent on-chain: {tx}")
         return tx
 
+    def queue_claim(self, platform: str, bounty_id: str, title: str, reward_usd: float):
+        """Queue a bounty claim for the next flush()."""
+        # A duplicate claim reverts, which would also revert everything batched with it
+        try:
+            key = self.w3.solidity_keccak(["string", "string"], [platform, bounty_id])
+            if self.contract.functions.bountyIndex(key).call():
+                log(f"Bounty already claimed on-chain: {platform}:{bounty_id}")
+                return
+        except Exception as e:
+            # Queue anyway: a duplicate fails gas estimation, and flush() then sends records singly
+            log(f"Claim lookup failed for {platform}:{bounty_id}: {e}")
+        reward_wei = int(reward_usd * 10**18)
+        self._queued.append(("claimBounty", [platform, bounty_id, title[:100], reward_wei]))
+
+    def queue_activity(self, chain: str, action: str, details: str):
+        """Queue an activity entry for the next flush()."""
+        self._queued.append(("logActivity", [chain, action, details[:500]]))
+
+    def flush(self):
+        """Send all queued records, in a single multicall transaction when possible.
+
+        If the multicall can't be sent (e.g. the deployed contract predates it, or
+        one record fails gas estimation), each record is sent as its own transaction
+        so one failure can't drop the others.
+        """
+        queued, self._queued = self._queued, []
+        if not self.enabled or not queued:
+            return None
+        # Only claims need confirmation; activity logs are fire-and-forget
+        wait = any(name == "claimBounty" for name, _ in queued)
+        if len(queued) > 1:
+            fn = self.contract.functions.multicall([
+                self.contract.encode_abi(name, args=args) for name, args in queued
+            ])
+            tx_hash = self._broadcast(fn)
+            if tx_hash is not None:
+                # Never resend once broadcast: the batch may still mine after a timeout
+                tx = self._confirm(tx_hash) if wait else tx_hash.hex()
+                if tx:
+                    log(f"{len(queued)} records {'written' if wait else 'sent'} on-chain: {tx}")
+                return tx
+            log("multicall not sent, sending records individually")
+
+        tx = None
+        for name, args in queued:
+            wait = name == "claimBounty"
+            sent = self._send_tx(self.contract.get_function_by_name(name)(*args), wait=wait)
+            if sent:
+                log(f"{name} {'written' if wait else 'sent'} on-chain: {sent}")
+                tx = sent
+        return tx
+
+
+# --- Scan Cache ---
+
+def _scan_cache_path(url: str, params: dict) -> Path:
+    key = hashlib.sha256(json.dumps([url, params], sort_keys=True).encode()).hexdigest()
+    return CACHE_DIR / "scan" / f"{key}.json"
+
+
+def _scan_cache_entry(url: str, params: dict) -> dict | None:
+    """Return the raw cache entry ({"ts", "data", "etag"}) for (url, params), fresh or not."""
+    try:
+        return json.loads(_scan_cache_path(url, params).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def scan_cache_get(url: str, params: dict):
+    """Return cached JSON for (url, params) if younger than SCAN_CACHE_TTL, else None."""
+    entry = _scan_cache_entry(url, params)
+    if entry and time.time() - entry["ts"] < SCAN_CACHE_TTL:
+        return entry["data"]
+    return None
+
+
+def scan_cache_put(url: str, params: dict, data, etag: str | None = None):
+    path = _scan_cache_path(url, params)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"ts": time.time(), "data": data, "etag": etag}))
+    except OSError as e:
+        log(f"  Scan cache write error: {e}")
+
 
 # --- Platform Scanners ---
 
-def scan_bountycaster() -> list[dict]:
+def scan_bountycaster(use_cache: bool = True) -> list[dict]:
     """Scan Bountycaster for open bounties."""
     bounties = []
     try:
         cfg = PLATFORMS["bountycaster"]
-        r = requests.get(cfg["url"], params=cfg["params"], timeout=15)
-        if r.status_code != 200:
-            log(f"  Bountycaster HTTP {r.status_code}")
-            return []
-        data = r.json()
+        data = scan_cache_get(cfg["url"], cfg["params"]) if use_cache else None
+        if data is None:
+            r = get_session().get(cfg["url"], params=cfg["params"], timeout=15)
+            if r.status_code != 200:
+                log(f"  Bountycaster HTTP {r.status_code}")
+                return []
+            data = r.json()
+            scan_cache_put(cfg["url"], cfg["params"], data)
         items = data if isinstance(data, list) else data.get("bounties", [])
         for item in items:
             title = item.get("title", item.get("text", ""))[:100]
@@ -170,67 +420,105 @@ def scan_bountycaster() -> list[dict]:
                 "reward": float(reward) if reward else 0,
                 "currency": currency,
                 "url": url,
-                "raw": item,
             })
     except Exception as e:
         log(f"  Bountycaster error: {e}")
     return bounties
 
 
-def scan_github_bounties() -> list[dict]:
-    """Search GitHub for issues with bounty/reward labels."""
+def _github_rate_limit_wait(r) -> float:
+    """Seconds to back off according to GitHub's rate-limit headers (0 = not limited)."""
+    if r.status_code not in (403, 429):
+        return 0
+    if r.headers.get("Retry-After"):
+        return float(r.headers["Retry-After"])
+    if r.headers.get("X-RateLimit-Remaining") == "0":
+        reset = int(r.headers.get("X-RateLimit-Reset", 0))
+        return max(reset - time.time(), 0) + 1
+    return 0
+
+
+def _github_headers() -> dict:
+    """GitHub API headers; GITHUB_TOKEN (if set) lifts the search rate limit to 30 req/min."""
+    headers = {"Accept": "application/vnd.github+json"}
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
+
+
+def _slim_issue(item: dict) -> dict:
+    """Keep only the issue fields the scanner reads (drops user, labels, reactions, ...)."""
+    slim = {k: item[k] for k in GITHUB_ISSUE_FIELDS if k in item}
+    slim["body"] = (item.get("body") or "")[:500]
+    return slim
+
+
+def _search_github(q: str, use_cache: bool = True) -> list[dict]:
+    """Run one GitHub issue search query, backing off once if rate limited.
+
+    Expired cache entries are revalidated with If-None-Match; a 304 reuses
+    the cached items without downloading or parsing a body.
+    """
     bounties = []
-    queries = [
-        "label:bounty state:open language:python",
-        "label:bounty state:open language:javascript",
-        "label:bounty state:open language:solidity",
-        "label:reward state:open",
-    ]
-    for q in queries:
-        try:
-            r = requests.get(
-                "https://api.github.com/search/issues",
-                params={"q": q, "per_page": 10, "sort": "created", "order": "desc"},
-                headers={"Accept": "application/vnd.github.v3+json"},
-                timeout=15,
-            )
-            if r.status_code != 200:
-                continue
-            for item in r.json().get("items", []):
-                title = item.get("title", "")[:100]
-                body = (item.get("body") or "")[:500].lower()
-                reward = 0
-                for marker in ["$", "usd", "usdc", "bounty"]:
-                    if marker in body:
-                        amounts = re.findall(r"\$\s*(\d+(?:,\d{3})*(?:\.\d{2})?)", body)
-                        if amounts:
-                            reward = float(amounts[0].replace(",", ""))
-                            break
-                bounties.append({
-                    "platform": "github",
-                    "id": str(item.get("number", "")),
-                    "title": title,
-                    "reward": reward,
-                    "currency": "USD",
-                    "url": item.get("html_url", ""),
-                    "repo": item.get("repository_url", "").split("/")[-1] if item.get("repository_url") else "",
-                })
-        except Exception as e:
-            log(f"  GitHub search error: {e}")
-        time.sleep(1)
+    url = "https://api.github.com/search/issues"
+    params = {"q": q, "per_page": 10, "sort": "created", "order": "desc"}
+    try:
+        entry = _scan_cache_entry(url, params)
+        fresh = use_cache and entry and time.time() - entry["ts"] < SCAN_CACHE_TTL
+        data = entry["data"] if fresh else None
+        if data is None:
+            headers = _github_headers()
+            if entry and entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            for _ in range(2):
+                r = get_session().get(url, params=params, headers=headers, timeout=15)
+                wait = _github_rate_limit_wait(r)
+                if not wait or wait > 60:
+                    break
+                log(f"  GitHub rate limited, retrying in {wait:.0f}s")
+                time.sleep(wait)
+            if r.status_code == 304:
+                data = entry["data"]
+                scan_cache_put(url, params, data, entry["etag"])
+            elif r.status_code != 200:
+                return []
+            else:
+                data = {"items": [_slim_issue(item) for item in r.json().get("items", [])]}
+                scan_cache_put(url, params, data, r.headers.get("ETag"))
+        for item in data.get("items", []):
+            title = item.get("title", "")[:100]
+            body = (item.get("body") or "")[:500].lower()
+            # Cheap substring check first: most issue bodies have no "$" at all
+            m = REWARD_RE.search(body) if "$" in body else None
+            reward = float(m.group(1).replace(",", "")) if m else 0
+            bounties.append({
+                "platform": "github",
+                "id": str(item.get("number", "")),
+                "title": title,
+                "reward": reward,
+                "currency": "USD",
+                "url": item.get("html_url", ""),
+                "repo": item.get("repository_url", "").split("/")[-1] if item.get("repository_url") else "",
+            })
+    except Exception as e:
+        log(f"  GitHub search error: {e}")
     return bounties
 
 
-def scan_ubounty() -> list[dict]:
+def scan_ubounty(use_cache: bool = True) -> list[dict]:
     """Scan UBounty.ai for open bounties."""
     bounties = []
     try:
         cfg = PLATFORMS["ubounty"]
-        r = requests.get(cfg["url"], params=cfg["params"], timeout=15)
-        if r.status_code != 200:
-            log(f"  UBounty HTTP {r.status_code}")
-            return []
-        data = r.json()
+        data = scan_cache_get(cfg["url"], cfg["params"]) if use_cache else None
+        if data is None:
+            r = get_session().get(cfg["url"], params=cfg["params"], timeout=15)
+            if r.status_code != 200:
+                log(f"  UBounty HTTP {r.status_code}")
+                return []
+            data = r.json()
+            scan_cache_put(cfg["url"], cfg["params"], data)
         items = data if isinstance(data, list) else data.get("bounties", data.get("data", []))
         for item in items:
             title = item.get("title", item.get("name", ""))[:100]
@@ -252,40 +540,100 @@ def scan_ubounty() -> list[dict]:
 
 def evaluate_bounty(bounty: dict) -> dict:
     """Evaluate if a bounty is worth pursuing."""
-    score = 0
-    reasons = []
-
-    if bounty["reward"] >= 500:
-        score += 3
-        reasons.append(f"High reward: ${bounty['reward']}")
-    elif bounty["reward"] >= 100:
-        score += 2
-        reasons.append(f"Good reward: ${bounty['reward']}")
-    elif bounty["reward"] >= MIN_REWARD_USD:
-        score += 1
-        reasons.append(f"Min reward: ${bounty['reward']}")
+    reward = bounty["reward"]
+    title = bounty["title"]
+
+    # Nothing to match and no reward: can't score, skip the keyword pass
+    if reward < MIN_REWARD_USD and not title:
+        bounty["score"] = 0
+        bounty["reasons"] = []
+        bounty["actionable"] = False
+        return bounty
+
+    if reward >= 500:
+        score, tier = 3, "High reward"
+    elif reward >= 100:
+        score, tier = 2, "Good reward"
+    elif reward >= MIN_REWARD_USD:
+        score, tier = 1, "Min reward"
     else:
-        reasons.append(f"Low/unknown reward: ${bounty['reward']}")
+        score, tier = 0, "Low/unknown reward"
 
-    title_lower = bounty["title"].lower()
-    matches = [kw for kw in CAPABILITY_KEYWORDS if kw in title_lower]
-    if matches:
-        score += len(matches)
-        reasons.append(f"Capability match: {', '.join(matches[:3])}")
+    found = set(KW_RE.findall(title.lower()))
+    matches = [kw for kw in CAPABILITY_KEYWORDS if kw in found]
+    score += len(matches)
+    actionable = score >= 2
+
+    # Reasons are only ever shown for actionable bounties; don't format them for the rest
+    reasons = []
+    if actionable:
+        reasons.append(f"{tier}: ${reward}")
+        if matches:
+            reasons.append(f"Capability match: {', '.join(matches[:3])}")
 
     bounty["score"] = score
     bounty["reasons"] = reasons
-    bounty["actionable"] = score >= 2
+    bounty["actionable"] = actionable
     return bounty
 
 
 # --- Delivery ---
 
-def deliver_bounty(bounty: dict) -> dict | None:
-    """Use claude -p to analyze a bounty and generate a deliverable."""
-    if not bounty.get("url"):
-        return None
+def _load_delivery_cache() -> dict:
+    try:
+        return json.loads(DELIVERY_CACHE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_delivery_cache(cache: dict):
+    # Drop expired analyses so the file doesn't grow with every URL ever analyzed
+    now = time.time()
+    fresh = {k: v for k, v in cache.items() if now - v["ts"] < DELIVERY_CACHE_TTL}
+    try:
+        DELIVERY_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        DELIVERY_CACHE.write_text(json.dumps(fresh))
+    except OSError as e:
+        log(f"  Delivery cache write error: {e}")
+
+
+def deliver_bounties(bounties: list[dict], use_cache: bool = True) -> list[dict | None]:
+    """Analyze several bounties, running the claude subprocesses concurrently.
+
+    Returns one analysis (or None) per input bounty, in order.
+    """
+    cache = _load_delivery_cache()
+    results: list[dict | None] = [None] * len(bounties)
+    misses = []
+    for i, bounty in enumerate(bounties):
+        if not bounty.get("url"):
+            continue
+        hit = cache.get(_delivery_key(bounty))
+        if use_cache and hit and time.time() - hit["ts"] < DELIVERY_CACHE_TTL:
+            log(f"  Using cached delivery analysis: {bounty['title'][:50]}")
+            results[i] = hit["analysis"]
+        else:
+            misses.append(i)
+
+    if misses:
+        with ThreadPoolExecutor(max_workers=DELIVERY_WORKERS) as ex:
+            analyses = list(ex.map(lambda i: _analyze_bounty(bounties[i]), misses))
+        # Single cache write after all worker threads finish, so they can't clobber each other's entries
+        for i, analysis in zip(misses, analyses):
+            results[i] = analysis
+            if analysis is not None:
+                cache[_delivery_key(bounties[i])] = {"ts": time.time(), "analysis": analysis}
+        _save_delivery_cache(cache)
+    return results
+
 
+def _delivery_key(bounty: dict) -> str:
+    # GitHub ids are per-repo issue numbers, so the URL is the only unique key
+    return bounty["url"] or f"{bounty['platform']}:{bounty['id']}"
+
+
+def _analyze_bounty(bounty: dict) -> dict | None:
+    """Use claude -p to analyze a bounty and generate a deliverable."""
     prompt = f"""Analyze this bounty and generate a plan to deliver it:
 
 Title: {bounty['title']}
@@ -320,61 +668,76 @@ Be concise. Output JSON with keys: feasible (bool), effort_hours (float), plan (
 
 # --- Main Scanning ---
 
-def scan_all() -> list[dict]:
+def scan_all(use_cache: bool = True) -> list[dict]:
     """Scan all platforms and return evaluated bounties."""
     all_bounties = []
 
-    log("Scanning Bountycaster...")
-    all_bounties.extend(scan_bountycaster())
-
-    log("Scanning GitHub bounties...")
-    all_bounties.extend(scan_github_bounties())
-
-    log("Scanning UBounty.ai...")
-    all_bounties.extend(scan_ubounty())
-
-    log(f"Found {len(all_bounties)} raw bounties. Evaluating...")
+    log("Scanning Bountycaster, GitHub bounties, UBounty.ai in parallel...")
+    # Every HTTP request gets its own worker, so the scan takes max-of-requests
+    with ThreadPoolExecutor(max_workers=len(GITHUB_QUERIES) + 2) as ex:
+        futures = [ex.submit(scan_bountycaster, use_cache)]
+        futures += [ex.submit(_search_github, q, use_cache) for q in GITHUB_QUERIES]
+        futures.append(ex.submit(scan_ubounty, use_cache))
+        for future in futures:
+            all_bounties.extend(future.result())
+
+    # Cross-posted bounties share a URL (or, failing that, a title)
+    seen = set()
+    deduped = []
+    for b in all_bounties:
+        key = b["url"] or b["title"].lower().strip()
+        if key in seen:
+            continue
+        seen.add(key)
+        deduped.append(b)
+    all_bounties = deduped
+
+    log(f"Found {len(all_bounties)} unique bounties. Evaluating...")
 
     evaluated = [evaluate_bounty(b) for b in all_bounties]
-    evaluated.sort(key=lambda x: x["score"], reverse=True)
 
+    # Only actionable bounties are ever shown in rank order; skipped ones are just counted
     actionable = [b for b in evaluated if b["actionable"]]
+    actionable.sort(key=lambda x: x["score"], reverse=True)
+    skipped = [b for b in evaluated if not b["actionable"]]
     log(f"Actionable: {len(actionable)} / {len(evaluated)}")
 
-    return evaluated
+    return actionable + skipped
 
 
 def print_report(bounties: list[dict], json_mode: bool = False):
     """Print bounty report."""
     if json_mode:
-        output = []
-        for b in bounties:
-            if b["actionable"]:
-                clean = {k: v for k, v in b.items() if k != "raw"}
-                output.append(clean)
-        print(json.dumps(output, indent=2, default=str))
+        output = [b for b in bounties if b["actionable"]]
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(output, default=str, option=orjson.OPT_INDENT_2) + b"\n")
+        sys.stdout.buffer.flush()
         return
 
-    print(f"\n{'='*60}")
-    print(f"  BOUNTY HUNTER REPORT — {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}")
-    print(f"{'='*60}\n")
+    # Build the whole report and write it once (one syscall instead of one per line)
+    lines = [
+        f"\n{'='*60}",
+        f"  BOUNTY HUNTER REPORT — {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}",
+        f"{'='*60}\n",
+    ]
 
     actionable = [b for b in bounties if b["actionable"]]
     skipped = [b for b in bounties if not b["actionable"]]
 
     if actionable:
-        print(f"  ACTIONABLE ({len(actionable)}):\n")
+        lines.append(f"  ACTIONABLE ({len(actionable)}):\n")
         for b in actionable:
             reward_str = f"${b['reward']:.0f} {b['currency']}" if b["reward"] else "negotiable"
-            print(f"  [{b['platform']}] {b['title'][:55]}")
-            print(f"    Reward: {reward_str} | Score: {b['score']}")
-            print(f"    URL: {b['url']}")
-            print(f"    Why: {'; '.join(b['reasons'])}")
-            print()
+            lines.append(f"  [{b['platform']}] {b['title'][:55]}")
+            lines.append(f"    Reward: {reward_str} | Score: {b['score']}")
+            lines.append(f"    URL: {b['url']}")
+            lines.append(f"    Why: {'; '.join(b['reasons'])}")
+            lines.append("")
     else:
-        print("  No actionable bounties found this scan.\n")
+        lines.append("  No actionable bounties found this scan.\n")
 
-    print(f"  SKIPPED: {len(skipped)} (low reward or poor match)\n")
+    lines.append(f"  SKIPPED: {len(skipped)} (low reward or poor match)\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -385,6 +748,9 @@ def main():
     parser.add_argument("--record", action="store_true", help="Record results on-chain")
     parser.add_argument("--cron", action="store_true", help="Cron mode: JSON output, log to chain")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached scan results")
+    parser.add_argument("--force-refresh", action="store_true", help="Ignore cached delivery analyses")
+    parser.add_argument("--deliver-top", type=int, default=1, help="Number of top bounties to analyze")
     args = parser.parse_args()
 
     if args.cron:
@@ -397,7 +763,7 @@ def main():
         args.scan = True
         args.evaluate = True
 
-    bounties = scan_all()
+    bounties = scan_all(use_cache=not args.no_cache)
     actionable = [b for b in bounties if b["actionable"]]
 
     # On-chain recording
@@ -405,29 +771,35 @@ def main():
     if args.record:
         recorder = BNBRecorder()
         if recorder.enabled:
-            summary = json.dumps({
+            summary = orjson.dumps({
                 "total_found": len(bounties),
                 "actionable": len(actionable),
                 "platforms": list({b["platform"] for b in bounties}),
                 "top_reward": max((b["reward"] for b in bounties), default=0),
                 "timestamp": datetime.now(timezone.utc).isoformat(),
-            })
-            recorder.log_activity("opbnb", "bounty_scan_completed", summary)
+            }).decode()
+            recorder.queue_activity("opbnb", "bounty_scan_completed", summary)
 
     # Delivery pipeline
     if args.deliver and actionable:
-        top = actionable[0]
-        log(f"Analyzing top target: {top['title'][:50]} (${top['reward']})")
-        analysis = deliver_bounty(top)
-        if analysis:
-            log(f"  Feasible: {analysis.get('feasible')}, Effort: {analysis.get('effort_hours')}h")
-            top["delivery_analysis"] = analysis
-            if recorder and recorder.enabled and analysis.get("feasible"):
-                recorder.claim_bounty(
-                    top["platform"], top["id"], top["title"], top["reward"]
-                )
-        else:
-            log("  Could not analyze bounty for delivery")
+        targets = actionable[:args.deliver_top]
+        for top in targets:
+            log(f"Analyzing top target: {top['title'][:50]} (${top['reward']})")
+        analyses = deliver_bounties(targets, use_cache=not args.force_refresh)
+        for top, analysis in zip(targets, analyses):
+            if analysis:
+                log(f"  {top['title'][:30]}: Feasible: {analysis.get('feasible')}, "
+                    f"Effort: {analysis.get('effort_hours')}h")
+                top["delivery_analysis"] = analysis
+                if recorder and recorder.enabled and analysis.get("feasible"):
+                    recorder.queue_claim(
+                        top["platform"], top["id"], top["title"], top["reward"]
+                    )
+            else:
+                log(f"  Could not analyze bounty for delivery: {top['title'][:30]}")
+
+    if recorder:
+        recorder.flush()
 
     print_report(bounties, json_mode=args.json or args.cron)
 